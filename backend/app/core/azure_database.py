@@ -19,6 +19,9 @@ class AzureDatabaseManager:
         self.db_name = os.getenv("MONGODB_DB_NAME", "cinescope")
         self.client: Optional[AsyncIOMotorClient] = None
         self.db = None
+        # Collection handles cached per name so repeated lookups reuse the
+        # same object on the shared pooled client
+        self._collections = {}
         
     async def connect(self):
         """Connect to Azure MongoDB service with fallback to local"""
@@ -36,6 +39,7 @@ class AzureDatabaseManager:
                     serverSelectionTimeoutMS=3000,  # Reduced timeout
                     connectTimeoutMS=5000,
                     maxPoolSize=50,
+                    minPoolSize=5,  # Keep warm connections so requests skip the TLS/auth handshake
                     retryWrites=False,  # Cosmos DB doesn't support retryWrites
                     ssl=True
                 )
@@ -47,6 +51,7 @@ class AzureDatabaseManager:
                     serverSelectionTimeoutMS=3000,
                     connectTimeoutMS=5000,
                     maxPoolSize=50,
+                    minPoolSize=5,  # Keep warm connections so requests skip the TLS/auth handshake
                     retryWrites=True,
                     ssl=True
                 )
@@ -92,6 +97,7 @@ class AzureDatabaseManager:
             self.database_type = "sqlite_fallback"
             self.client = None
             self.db = None
+            self._collections.clear()
             logger.info("✅ Fallback storage initialized")
         except Exception as e:
             logger.error(f"❌ Fallback initialization failed: {e}")
@@ -132,15 +138,22 @@ class AzureDatabaseManager:
             logger.warning(f"⚠️ Index creation failed (might already exist): {e}")
     
     async def get_collection(self, collection_name: str):
-        """Get a specific collection"""
+        """Get a specific collection (cached handle on the shared client)"""
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
         if self.db is None:
             await self.connect()
-        return self.db[collection_name]
-    
+        collection = self.db[collection_name] if self.db is not None else None
+        if collection is not None:
+            self._collections[collection_name] = collection
+        return collection
+
     async def close(self):
         """Close database connection"""
         if self.client:
             self.client.close()
+            self._collections.clear()
             logger.info("🔌 Database connection closed")
 
 # Global database instance
@@ -12,6 +12,23 @@ import asyncio
 from typing import Any, Optional, Dict, List
 from pathlib import Path
 
+# orjson serializes/deserializes several times faster than the stdlib json
+# module; fall back gracefully when it is not installed
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _loads(raw) -> Any:
+        return orjson.loads(raw)
+except ImportError:
+    def _dumps(value: Any) -> str:
+        return json.dumps(value)
+
+    def _loads(raw) -> Any:
+        return json.loads(raw)
+
 class HybridCache:
     """
     Hybrid caching system that combines:
@@ -90,7 +107,7 @@ class HybridCache:
         row = cursor.fetchone()
         
         if row and current_time < row[1]:
-            value = json.loads(row[0])
+            value = _loads(row[0])
             
             # Update access stats
             conn.execute(
@@ -124,7 +141,7 @@ class HybridCache:
         """
         current_time = time.time()
         expires_at = current_time + ttl
-        json_value = json.dumps(value)
+        json_value = _dumps(value)
         
         # Store in memory cache (RAM)
         with self._lock:
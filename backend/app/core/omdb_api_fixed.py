@@ -35,7 +35,9 @@ class FixedOMDbAPI:
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=10),
-                connector=aiohttp.TCPConnector(limit=10)
+                connector=aiohttp.TCPConnector(
+                    limit=10, ttl_dns_cache=300, keepalive_timeout=60
+                )
             )
         return self.session
     
@@ -781,6 +781,18 @@ async def startup_event():
     logger.info("✅ All endpoints registered")
     logger.info("🎬 Ready to serve movie data!")
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared resources (pooled HTTP session) on shutdown"""
+    try:
+        from app.core.service_manager import service_manager
+        if service_manager._movie_service is not None:
+            await service_manager._movie_service.close()
+            logger.info("🔌 Closed shared HTTP session")
+    except Exception as e:
+        logger.warning(f"Shutdown cleanup failed: {e}")
+
 if __name__ == "__main__":
     print("🚀 Starting CineScope Backend...")
     print("📡 Server will be available at: http://localhost:8000")
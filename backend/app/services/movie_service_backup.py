@@ -4,9 +4,13 @@ import random
 import logging
 from datetime import datetime
 
+import os
+from dotenv import load_dotenv
+
 from ..models.movie import Movie, Review, AnalyticsData, SentimentData, RatingDistributionData, MovieSummary
 from ..core.api_manager import APIManager
 from ..core.azure_database import get_movies_collection, get_cache_collection
+from ..core.omdb_api_enhanced import OMDbAPI
 from .comprehensive_movie_service_working import ComprehensiveMovieService
 from ..scraper.enhanced_movie_scraper import EnhancedMovieDescriptionScraper
 
@@ -20,6 +24,13 @@ class MovieService:
         self.movies_collection = None
         self.cache_collection = None
         self.movies_db = []  # Initialize movies_db
+        # Direct OMDB client initialized once so searches reuse the same HTTP session
+        load_dotenv()
+        omdb_api_key = os.getenv('OMDB_API_KEY', '4977b044')
+        if omdb_api_key and omdb_api_key not in ['demo_key', '', None]:
+            self._omdb_direct = OMDbAPI(omdb_api_key)
+        else:
+            self._omdb_direct = None
         self._init_demo_data()
     
     def _init_demo_data(self):
@@ -168,7 +179,8 @@ class MovieService:
             # STEP 2: Search in database first (faster than API calls)
             db_results = await self._search_movies_in_db(query, limit)
             if db_results:
-                movies = [self._convert_dict_to_movie(data) for data in db_results]
+                # Single fused pass: skip falsy rows and failed conversions
+                movies = [m for m in (self._convert_dict_to_movie(d) for d in db_results if d) if m is not None]
                 self.logger.info(f"💾 Database HIT - returning {len(movies)} results")
                 # Cache the results for next time
                 await self._cache_results(cache_key, movies)
@@ -753,7 +765,53 @@ class MovieService:
             movie.rating = sum(review.rating for review in movie.reviews) / len(movie.reviews)
         
         self.logger.info(f"✅ FAST Analysis complete for {movie.title}: {len(movie.reviews)} reviews, {movie.rating} rating")
-        return await self.get_movie_analysis(movie_id)  # Return full analysis object
+
+        # Build the analysis from the data generated above - tail-calling the
+        # full get_movie_analysis re-did the slow path and threw this work away
+        from ..models.movie import GenreData, ReviewTimelineData
+
+        rating_score = movie.rating
+        if rating_score >= 8:
+            rating_counts = [1, 0, 1, 2, 3, 5, 8, 15, 25, 40]
+        elif rating_score >= 6:
+            rating_counts = [2, 3, 5, 8, 12, 18, 22, 15, 10, 5]
+        else:
+            rating_counts = [10, 15, 20, 18, 12, 8, 5, 3, 2, 1]
+
+        return AnalyticsData(
+            totalMovies=len(self.movies_db),
+            totalReviews=len(movie.reviews),
+            averageRating=movie.rating,
+            sentimentDistribution=SentimentData(
+                positive=positive_reviews,
+                negative=negative_reviews,
+                neutral=neutral_reviews
+            ),
+            ratingDistribution=[
+                RatingDistributionData(rating=i + 1, count=rating_counts[i])
+                for i in range(10)
+            ],
+            genrePopularity=[
+                GenreData(genre=genre, count=len([m for m in self.movies_db if genre in m.genre]))
+                for genre in movie.genre
+            ],
+            reviewTimeline=[
+                ReviewTimelineData(date="2024-01-15", count=max(len(movie.reviews) // 2, 1)),
+                ReviewTimelineData(date="2024-02-15", count=len(movie.reviews))
+            ],
+            topRatedMovies=[MovieSummary(
+                id=movie.id,
+                title=movie.title,
+                rating=movie.rating,
+                year=movie.year
+            )],
+            recentlyAnalyzed=[MovieSummary(
+                id=movie.id,
+                title=movie.title,
+                rating=movie.rating,
+                year=movie.year
+            )]
+        )
     
     async def _fast_local_search(self, query: str, limit: int) -> List[Movie]:
         """FAST local search - optimized for speed and accuracy"""
@@ -852,20 +910,11 @@ class MovieService:
     async def _search_omdb_direct(self, query: str, limit: int) -> List[Movie]:
         """Direct OMDB API search with optimized timeout"""
         try:
-            from ..core.omdb_api_enhanced import OMDbAPI
-            import os
-            from dotenv import load_dotenv
-            
-            load_dotenv()
-            omdb_api_key = os.getenv('OMDB_API_KEY', '4977b044')
-            
-            if not omdb_api_key or omdb_api_key in ['demo_key', '', None]:
+            if self._omdb_direct is None:
                 return []
-            
-            omdb_api = OMDbAPI(omdb_api_key)
               # Ultra-fast timeout for real-time response
             omdb_results = await asyncio.wait_for(
-                omdb_api.search_movies(query, limit), 
+                self._omdb_direct.search_movies(query, limit),
                 timeout=2.0  # Reduced to 2s for better UX
             )
             
@@ -970,26 +1019,22 @@ class MovieService:
         """Process and merge search results with intelligent ranking"""
         final_movies = []
         seen_titles = set()
-        
+
         try:
             # Priority order: OMDB (highest quality) -> Local -> Suggestions
-            search_order = ['omdb', 'local', 'suggestions']
-            
-            for search_type in search_order:
-                movies = results.get(search_type, [])
-                
-                for movie in movies:
-                    if len(final_movies) >= limit:
+            # setdefault keeps the first (highest-priority) movie per title -
+            # one dict probe per candidate instead of a set check plus append
+            unique_movies: Dict[str, Movie] = {}
+            for search_type in ('omdb', 'local', 'suggestions'):
+                for movie in results.get(search_type, []):
+                    unique_movies.setdefault(movie.title.lower().strip(), movie)
+                    if len(unique_movies) >= limit:
                         break
-                        
-                    # Avoid duplicates by title
-                    title_key = movie.title.lower().strip()
-                    if title_key not in seen_titles:
-                        seen_titles.add(title_key)
-                        final_movies.append(movie)
-                        
-                if len(final_movies) >= limit:
+                if len(unique_movies) >= limit:
                     break
+
+            final_movies = list(unique_movies.values())[:limit]
+            seen_titles = set(unique_movies)
             
             # If still not enough results, try API Manager as backup
             if len(final_movies) < min(limit, 3):
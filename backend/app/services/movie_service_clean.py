@@ -20,6 +20,13 @@ class MovieService:
         self.movies_collection = None
         self.cache_collection = None
         self.movies_db = []
+        # Precomputed lowercase search fields, rebuilt lazily when movies_db changes size
+        self._search_index = []
+        self._search_index_size = -1
+        # Presorted views backing popular/recent/top-rated, rebuilt the same way
+        self._sorted_by_rating = []
+        self._sorted_by_year = []
+        self._sorted_views_size = -1
         self._init_demo_data()
     
     def _init_demo_data(self):
@@ -196,19 +203,27 @@ class MovieService:
         self.logger.warning(f"❌ Movie {movie_id} not found anywhere")
         return None
     
+    def _get_search_index(self):
+        """Lowercased (title, plot, genres, movie) tuples, rebuilt when movies_db changes"""
+        if self._search_index_size != len(self.movies_db):
+            self._search_index = [
+                (m.title.lower(), m.plot.lower(), " ".join(m.genre).lower(), m)
+                for m in self.movies_db
+            ]
+            self._search_index_size = len(self.movies_db)
+        return self._search_index
+
     async def search_movies(self, query: str, limit: int = 10) -> List[Movie]:
         """Search movies by title, plot, or genre"""
         self.logger.info(f"🔍 Searching for: {query}")
-        
-        # Search in local database first
-        results = []
+
+        # Search in local database first using precomputed lowercase fields
         query_lower = query.lower()
-        
-        for movie in self.movies_db:
-            if (query_lower in movie.title.lower() or 
-                query_lower in movie.plot.lower() or 
-                any(query_lower in genre.lower() for genre in movie.genre)):
-                results.append(movie)
+        results = [
+            movie
+            for title, plot, genres, movie in self._get_search_index()
+            if query_lower in title or query_lower in plot or query_lower in genres
+        ]
         
         # If we have enough results from local DB, return them
         if len(results) >= limit:
@@ -253,31 +268,34 @@ class MovieService:
         # Create a more dynamic seed that changes every minute
         now = datetime.now()
         minute_seed = now.hour * 60 + now.minute + (now.second // 10)
-        random.seed(minute_seed)
-        
-        # Use existing movies and shuffle them
-        suggestions = self.movies_db.copy()
-        random.shuffle(suggestions)
-        
-        return suggestions[:limit]
+
+        # Sample with a local seeded generator: picks only `limit` movies
+        # without copying/shuffling the whole list or reseeding the global RNG
+        rng = random.Random(minute_seed)
+        return rng.sample(self.movies_db, min(limit, len(self.movies_db)))
     
+    def _get_sorted_views(self):
+        """Rating- and year-sorted views, rebuilt lazily when movies_db changes"""
+        if self._sorted_views_size != len(self.movies_db):
+            self._sorted_by_rating = sorted(self.movies_db, key=lambda x: x.rating, reverse=True)
+            self._sorted_by_year = sorted(self.movies_db, key=lambda x: x.year, reverse=True)
+            self._sorted_views_size = len(self.movies_db)
+        return self._sorted_by_rating, self._sorted_by_year
+
     async def get_popular_movies(self, limit: int = 12) -> List[Movie]:
         """Get popular movies"""
-        # Sort by rating and return top movies
-        popular = sorted(self.movies_db, key=lambda x: x.rating, reverse=True)
-        return popular[:limit]
-    
+        # Slice the presorted rating view instead of re-sorting per request
+        return self._get_sorted_views()[0][:limit]
+
     async def get_recent_movies(self, limit: int = 12) -> List[Movie]:
         """Get recent movies"""
-        # Sort by year and return most recent
-        recent = sorted(self.movies_db, key=lambda x: x.year, reverse=True)
-        return recent[:limit]
-    
+        # Slice the presorted year view instead of re-sorting per request
+        return self._get_sorted_views()[1][:limit]
+
     async def get_top_rated_movies(self, limit: int = 12) -> List[Movie]:
         """Get top rated movies"""
-        # Sort by rating
-        top_rated = sorted(self.movies_db, key=lambda x: x.rating, reverse=True)
-        return top_rated[:limit]
+        # Same rating view as get_popular_movies
+        return self._get_sorted_views()[0][:limit]
     
     async def _update_movie_in_db(self, movie: Movie):
         """Update movie in the local database"""